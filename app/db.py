@@ -24,7 +24,17 @@ class SoftDeleteSession(SessionBase):
 
 def get_engine():
     settings = get_settings()
-    return create_engine(settings.database_url, pool_pre_ping=True)
+    if settings.database_url.startswith("sqlite"):
+        # SQLite (used in tests) does not take QueuePool sizing arguments.
+        return create_engine(settings.database_url, pool_pre_ping=True)
+    return create_engine(
+        settings.database_url,
+        pool_pre_ping=True,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle,
+        insertmanyvalues_page_size=1000,
+    )
 
 
 SessionLocal = sessionmaker(
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import (
+    Boolean,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db import Base
@@ -20,7 +30,7 @@ class Race(SoftDeleteMixin, Base):
     race_timezone: Mapped[str] = mapped_column(String(100))
 
     race_parts: Mapped[list["RacePart"]] = relationship(
-        "RacePart", back_populates="race", cascade="all, delete-orphan"
+        "RacePart", back_populates="race", cascade="all, delete-orphan", lazy="selectin"
     )
     participants: Mapped[list["Participant"]] = relationship(
         "Participant", back_populates="race", cascade="all, delete-orphan"
@@ -45,7 +55,11 @@ class RacePart(SoftDeleteMixin, Base):
 
 class Participant(SoftDeleteMixin, Base):
     __tablename__ = "participants"
-    __table_args__ = (UniqueConstraint("race_id", "participant_id", name="uq_participant"),)
+    __table_args__ = (
+        UniqueConstraint("race_id", "participant_id", name="uq_participant"),
+        Index("ix_participants_race_group", "race_id", "group"),
+        Index("ix_participants_race_sex", "race_id", "sex"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     race_id: Mapped[str] = mapped_column(ForeignKey("races.race_id"))
@@ -67,7 +81,7 @@ class Organiser(Base):
     password_hash: Mapped[str] = mapped_column(String(255))
 
     races: Mapped[list["OrganiserRace"]] = relationship(
-        "OrganiserRace", back_populates="organiser", cascade="all, delete-orphan"
+        "OrganiserRace", back_populates="organiser", cascade="all, delete-orphan", lazy="selectin"
     )
 
 
@@ -85,6 +99,25 @@ class OrganiserRace(Base):
 
 class TimingEvent(SoftDeleteMixin, Base):
     __tablename__ = "timing_events"
+    __table_args__ = (
+        Index("ix_te_race_part_participant", "race_id", "race_part_id", "participant_id"),
+        Index("ix_te_race_part_group", "race_id", "race_part_id", "group"),
+        # Matches the ORDER BY server_time DESC used by the event lists.
+        Index("ix_te_race_part_server", "race_id", "race_part_id", text("server_time DESC")),
+        # Partial index for the per-organiser pending end-event lookups.
+        Index(
+            "ix_te_pending",
+            "race_id",
+            "race_part_id",
+            "created_by_username",
+            postgresql_where=text(
+                'participant_id IS NULL AND "group" IS NULL AND end_time IS NOT NULL'
+            ),
+            sqlite_where=text(
+                'participant_id IS NULL AND "group" IS NULL AND end_time IS NOT NULL'
+            ),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     race_id: Mapped[str] = mapped_column(ForeignKey("races.race_id"))
@@ -7,6 +7,10 @@ import os
 
 class Settings(BaseModel):
     database_url: str = os.getenv("DATABASE_URL", None)
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    thread_pool_tokens: int = int(os.getenv("THREAD_POOL_TOKENS", "100"))
     admin_username: str = os.getenv("ADMIN_USERNAME", "admin")
     admin_password: str = os.getenv("ADMIN_PASSWORD", "admin")
     secret_key: str = os.getenv("SECRET_KEY", "change-me")
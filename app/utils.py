@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 from datetime import date, datetime, time
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 
+@lru_cache(maxsize=256)
+def zoneinfo_for(name: str) -> ZoneInfo:
+    """ZoneInfo instances memoized per zone name; first construction reads tzdata."""
+    return ZoneInfo(name)
+
+
 def parse_duration_to_seconds(value: str) -> int:
     value = value.strip()
     parts = value.split(":")
@@ -27,10 +34,10 @@ def format_seconds(seconds: int) -> str:
 
 
 def parse_time_or_now(
-    value: str, race_date: date, race_timezone: str, server_now: datetime
+    value: str, race_date: date, race_timezone: str | ZoneInfo, server_now: datetime
 ) -> datetime:
     value = value.strip().upper()
-    tz = ZoneInfo(race_timezone)
+    tz = race_timezone if isinstance(race_timezone, ZoneInfo) else zoneinfo_for(race_timezone)
     if value == "NOW":
         return server_now.astimezone(tz)
     parts = value.split(":")
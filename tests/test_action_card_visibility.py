@@ -44,6 +44,7 @@ class ActionCardVisibilityTests(unittest.TestCase):
             race=self.race,
             race_parts=[self.part, self.overall_part],
             user=None,
+            can_manage=False,
         )
 
         self.assertNotIn("Manage Race Parts", html)
@@ -54,7 +55,8 @@ class ActionCardVisibilityTests(unittest.TestCase):
             "race.html",
             race=self.race,
             race_parts=[self.part, self.overall_part],
-            user={"role": "admin", "race_ids": [self.race.race_id]},
+            user={"role": "admin"},
+            can_manage=True,
         )
 
         self.assertIn("Manage Race Parts", html)
@@ -67,7 +69,7 @@ class ActionCardVisibilityTests(unittest.TestCase):
             race=self.race,
             participants=[],
             error=None,
-            user={"role": "admin", "race_ids": [self.race.race_id]},
+            user={"role": "admin"},
         )
 
         self.assertIn("Download QR Codes", html)
@@ -86,6 +88,7 @@ class ActionCardVisibilityTests(unittest.TestCase):
             groups=[],
             sexes=[],
             user=None,
+            can_manage=False,
         )
 
         self.assertNotIn("Manage Timing Events", html)
@@ -102,7 +105,8 @@ class ActionCardVisibilityTests(unittest.TestCase):
             parts=self.parts,
             groups=[],
             sexes=[],
-            user={"role": "admin", "race_ids": [self.race.race_id]},
+            user={"role": "admin"},
+            can_manage=True,
         )
 
         self.assertIn("Manage Timing Events", html)
@@ -137,7 +141,7 @@ class ActionCardVisibilityTests(unittest.TestCase):
             "submit_start.html",
             race=self.race,
             race_part_id=self.part.race_part_id,
-            user={"role": "admin", "race_ids": [self.race.race_id]},
+            user={"role": "admin"},
         )
 
         self.assertIn(
@@ -154,7 +158,7 @@ class ActionCardVisibilityTests(unittest.TestCase):
             start_events=[],
             selected_start_event_choice="latest",
             start_events_endpoint=f"/race/{self.race.race_id}/part/{self.part.race_part_id}/timer/start-events",
-            user={"role": "admin", "race_ids": [self.race.race_id]},
+            user={"role": "admin"},
         )
 
         self.assertIn('id="toggle-timer"', html)
@@ -170,7 +174,7 @@ class ActionCardVisibilityTests(unittest.TestCase):
             start_events=[],
             selected_start_event_choice="latest",
             start_events_endpoint=f"/race/{self.race.race_id}/part/{self.part.race_part_id}/timer/start-events",
-            user={"role": "admin", "race_ids": [self.race.race_id]},
+            user={"role": "admin"},
         )
 
         self.assertIn("pending-end-meta", html)
@@ -187,7 +191,7 @@ class ActionCardVisibilityTests(unittest.TestCase):
             start_events=[],
             selected_start_event_choice="latest",
             start_events_endpoint=f"/race/{self.race.race_id}/part/{self.part.race_part_id}/timer/start-events",
-            user={"role": "admin", "race_ids": [self.race.race_id]},
+            user={"role": "admin"},
         )
 
         self.assertIn('id="pending-end-max-counter"', html)
@@ -203,7 +207,7 @@ class ActionCardVisibilityTests(unittest.TestCase):
             start_events=[],
             selected_start_event_choice="latest",
             start_events_endpoint=f"/race/{self.race.race_id}/part/{self.part.race_part_id}/timer/start-events",
-            user={"role": "admin", "race_ids": [self.race.race_id]},
+            user={"role": "admin"},
         )
 
         self.assertIn('option value="latest" selected', html)
@@ -215,7 +219,7 @@ class ActionCardVisibilityTests(unittest.TestCase):
             "wave_starts.html",
             race=self.race,
             race_part_id=self.part.race_part_id,
-            user={"role": "admin", "race_ids": [self.race.race_id]},
+            user={"role": "admin"},
         )
 
         self.assertIn('id="wave-live-timer-panel"', html)
@@ -0,0 +1,96 @@
+import io
+import os
+import unittest
+from datetime import date
+
+from fastapi import HTTPException, UploadFile
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from app.db import Base
+from app.main import (
+    apply_race_parts_csv,
+    pop_csv_preview,
+    stash_csv_preview,
+    upload_race_parts_csv,
+)
+from app.models import Race, RacePart
+
+
+class FakeRequest:
+    def __init__(self, user: dict | None) -> None:
+        self.session = {"user": user} if user else {}
+        self.state = type("State", (), {})()
+
+
+class CsvPreviewStashTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.db = Session(self.engine)
+        self.db.add_all(
+            [
+                Race(race_id="race-1", race_date=date(2026, 1, 1), race_timezone="UTC"),
+                RacePart(
+                    race_id="race-1",
+                    race_part_id="Overall",
+                    race_order=-1,
+                    is_overall=True,
+                ),
+            ]
+        )
+        self.db.commit()
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.engine.dispose()
+
+    def admin_request(self) -> FakeRequest:
+        return FakeRequest({"role": "admin", "username": "admin"})
+
+    def upload(self, csv_text: str):
+        file = UploadFile(io.BytesIO(csv_text.encode("utf-8")), filename="parts.csv")
+        return upload_race_parts_csv(self.admin_request(), "race-1", file, self.db)
+
+    def test_upload_then_apply_round_trip(self) -> None:
+        response = self.upload("race_part_id,race_order\nLeg1,1\nLeg2,2\n")
+        token = response.context["payload"]
+
+        redirect = apply_race_parts_csv(self.admin_request(), "race-1", token, self.db)
+
+        self.assertEqual(redirect.status_code, 303)
+        part_ids = self.db.scalars(
+            select(RacePart.race_part_id).where(
+                RacePart.race_id == "race-1", RacePart.is_overall.is_(False)
+            )
+        ).all()
+        self.assertEqual(sorted(part_ids), ["Leg1", "Leg2"])
+
+    def test_unknown_token_returns_400(self) -> None:
+        with self.assertRaises(HTTPException) as caught:
+            pop_csv_preview("not-a-token")
+        self.assertEqual(caught.exception.status_code, 400)
+
+    def test_replayed_token_returns_400(self) -> None:
+        token = stash_csv_preview({"added": [], "modified": [], "ignored": []})
+
+        pop_csv_preview(token)
+
+        with self.assertRaises(HTTPException) as caught:
+            pop_csv_preview(token)
+        self.assertEqual(caught.exception.status_code, 400)
+
+    def test_replayed_apply_rejects_second_submit(self) -> None:
+        response = self.upload("race_part_id,race_order\nLeg1,1\n")
+        token = response.context["payload"]
+        apply_race_parts_csv(self.admin_request(), "race-1", token, self.db)
+
+        with self.assertRaises(HTTPException) as caught:
+            apply_race_parts_csv(self.admin_request(), "race-1", token, self.db)
+        self.assertEqual(caught.exception.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
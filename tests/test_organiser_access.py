@@ -0,0 +1,99 @@
+import os
+import unittest
+from datetime import date
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from app.db import Base
+from app.main import (
+    clear_organiser_race_cache,
+    organiser_manages_race,
+    replace_organiser_races,
+    require_organiser,
+)
+from app.models import Organiser, OrganiserRace, Race
+
+
+class FakeRequest:
+    def __init__(self, user: dict | None) -> None:
+        self.session = {"user": user} if user else {}
+        self.state = type("State", (), {})()
+
+
+class OrganiserAccessTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.db = Session(self.engine)
+        self.db.add_all(
+            [
+                Race(race_id="race-1", race_date=date(2026, 1, 1), race_timezone="UTC"),
+                Race(race_id="race-2", race_date=date(2026, 1, 2), race_timezone="UTC"),
+            ]
+        )
+        organiser = Organiser(username="organiser", password_hash="hash")
+        self.db.add(organiser)
+        self.db.flush()
+        self.organiser_id = organiser.id
+        self.db.add(OrganiserRace(organiser_id=organiser.id, race_id="race-1"))
+        self.db.commit()
+        clear_organiser_race_cache()
+
+    def tearDown(self) -> None:
+        clear_organiser_race_cache()
+        self.db.close()
+        self.engine.dispose()
+
+    def organiser_user(self) -> dict:
+        return {
+            "role": "organiser",
+            "username": "organiser",
+            "organiser_id": self.organiser_id,
+        }
+
+    def test_organiser_manages_only_assigned_races(self) -> None:
+        user = self.organiser_user()
+
+        self.assertTrue(organiser_manages_race(self.db, user, "race-1"))
+        self.assertFalse(organiser_manages_race(self.db, user, "race-2"))
+
+    def test_admin_manages_every_race(self) -> None:
+        user = {"role": "admin", "username": "admin"}
+
+        self.assertTrue(organiser_manages_race(self.db, user, "race-2"))
+
+    def test_anonymous_user_manages_nothing(self) -> None:
+        self.assertFalse(organiser_manages_race(self.db, None, "race-1"))
+
+    def test_require_organiser_allows_assigned_race(self) -> None:
+        request = FakeRequest(self.organiser_user())
+
+        require_organiser(request, "race-1", self.db)
+
+    def test_require_organiser_rejects_unassigned_race(self) -> None:
+        request = FakeRequest(self.organiser_user())
+
+        with self.assertRaises(HTTPException) as caught:
+            require_organiser(request, "race-2", self.db)
+        self.assertEqual(caught.exception.status_code, 403)
+
+    def test_reassignment_takes_effect_without_relogin(self) -> None:
+        user = self.organiser_user()
+        self.assertTrue(organiser_manages_race(self.db, user, "race-1"))
+        self.assertFalse(organiser_manages_race(self.db, user, "race-2"))
+
+        organiser = self.db.get(Organiser, self.organiser_id)
+        assert organiser is not None
+        replace_organiser_races(self.db, organiser, ["race-2"])
+        self.db.commit()
+
+        self.assertFalse(organiser_manages_race(self.db, user, "race-1"))
+        self.assertTrue(organiser_manages_race(self.db, user, "race-2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
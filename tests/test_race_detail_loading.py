@@ -0,0 +1,54 @@
+import os
+import unittest
+from datetime import date
+
+from sqlalchemy import create_engine
+from starlette.requests import Request
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from app.db import Base, SoftDeleteSession
+from app.main import race_detail
+from app.models import Race, RacePart
+
+
+class RaceDetailLoadingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.db = SoftDeleteSession(bind=self.engine)
+
+        race = Race(race_id="spring-run", race_date=date(2026, 4, 1), race_timezone="UTC")
+        self.db.add(race)
+        self.db.add_all(
+            [
+                RacePart(race_id=race.race_id, race_part_id="Overall", race_order=-1, is_overall=True),
+                RacePart(race_id=race.race_id, race_part_id="Leg1", race_order=1, is_overall=False),
+            ]
+        )
+        self.db.commit()
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.engine.dispose()
+
+    def make_request(self) -> Request:
+        return Request(
+            {
+                "type": "http",
+                "method": "GET",
+                "path": "/race/spring-run",
+                "headers": [],
+                "session": {},
+            }
+        )
+
+    def test_race_detail_renders_with_raiseload_guard(self) -> None:
+        response = race_detail(self.make_request(), "spring-run", self.db)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"Leg1", response.body)
+
+
+if __name__ == "__main__":
+    unittest.main()